@@ -2,6 +2,8 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
@@ -14,8 +16,6 @@ from haystack.utils.type_serialization import deserialize_type
 with LazyImport("Run 'pip install flatten_json' Github - https://github.com/amirziai/flatten ") as flatten_import:
     from flatten_json import flatten
 
-import json
-
 logger = logging.getLogger(__name__)
 
 
@@ -28,7 +28,7 @@ class JSONToDocument:
     Converts JSON files to Documents by flattening the JSON and then
     mapping it to content field of the Document class.  The number of
     Document objects will be the same as the number of sources provided.  The
-    assumption is that the JSON is encoded in utf-8
+    JSON can be encoded in UTF-8, UTF-16 or UTF-32.
 
 
     :param sources:
@@ -78,15 +78,22 @@ flattened JSON
     """
 
     
-    def __init__(self: "JSONToDocument") -> None:
+    def __init__(self: "JSONToDocument", max_workers: int = 1) -> None:
         """
         Create a JSONToDocument component.
+
+        :param max_workers:
+            The number of threads used to convert the sources.
+            Sources are read and parsed independently of each other, so several threads can overlap their file I/O
+            when converting many files. The default of 1 converts the sources sequentially in the calling thread.
+        :raises ValueError:
+            If `max_workers` is smaller than 1.
         """
 
         flatten_import.check()
-
-
-
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}.")
+        self.max_workers = max_workers
 
     @component.output_types(documents=List[Document])
     def run(
@@ -110,40 +117,52 @@ flattened JSON
             A dictionary with the following keys:
             - `documents`: Created Documents
         """
-        documents = []
-
         meta_list = normalize_metadata(meta, sources_count=len(sources))
 
-        for source, metadata in zip(sources, meta_list):
-            try:
-                bytestream = get_bytestream_from_source(source)
-            except Exception as e:
-                logger.warning("Could not read {source}. Skipping it. Error: {error}", source=source, error=e)
-                continue
-            try:
-                # Convert the ByteStream data to a string
-                json_str = bytestream.data.decode("utf-8")
-
-                # Load the string into a dictionary
-                json_dict = json.loads(json_str)
-
-                # Flatten the dictionary
-                flattened_json_dict = flatten(json_dict)
-
-                # Convert to a string
-                flattened_string = json.dumps(flattened_json_dict)
-
-
-            except Exception as e:
-                logger.warning(
-                    "Could not convert file {source}. Skipping it. Error message: {error}", source=source, error=e
-                )
-                continue
+        # don't use multithreading if there's only one source
+        if self.max_workers > 1 and len(sources) > 1:
+            # executor.map yields the results in the order of the sources
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = list(executor.map(self._convert, sources, meta_list))
+        else:
+            results = [self._convert(source, metadata) for source, metadata in zip(sources, meta_list)]
 
+        documents = [document for document in results if document is not None]
 
+        return {"documents": documents}
 
-            merged_metadata = {**bytestream.meta, **metadata}
-            document = Document(content=flattened_string, meta=merged_metadata)
-            documents.append(document)
+    def _convert(self, source: Union[str, Path, ByteStream], metadata: Dict[str, Any]) -> Optional[Document]:
+        """
+        Converts a single JSON source to a Document.
 
-        return {"documents": documents}
+        :param source:
+            A file path or ByteStream object.
+        :param metadata:
+            Metadata to attach to the Document.
+        :returns:
+            The created Document, or `None` if the source could not be read or converted.
+        """
+        try:
+            bytestream = get_bytestream_from_source(source)
+        except Exception as e:
+            logger.warning("Could not read {source}. Skipping it. Error: {error}", source=source, error=e)
+            return None
+        try:
+            # Load the ByteStream data into a dictionary.
+            # json.loads accepts bytes directly, which avoids an intermediate decoded copy of the data
+            # and detects UTF-8 (with or without a byte order mark), UTF-16 and UTF-32 encoded JSON
+            json_dict = json.loads(bytestream.data)
+
+            # Flatten the dictionary
+            flattened_json_dict = flatten(json_dict)
+
+            # Convert to a string
+            flattened_string = json.dumps(flattened_json_dict)
+        except Exception as e:
+            logger.warning(
+                "Could not convert file {source}. Skipping it. Error message: {error}", source=source, error=e
+            )
+            return None
+
+        merged_metadata = {**bytestream.meta, **metadata}
+        return Document(content=flattened_string, meta=merged_metadata)
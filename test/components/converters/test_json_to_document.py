@@ -4,45 +4,53 @@
 import logging
 from pathlib import Path
 import json
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
 import pytest
 
 from haystack.dataclasses import ByteStream
 from haystack.components.converters.json import JSONToDocument
 
+SAMPLE_JSON = {
+    "store": {
+        "book": [
+            {"category": "fiction", "price": 8.95, "title": "Book A"},
+            {"category": "non-fiction", "price": 12.99, "title": "Book B"},
+        ]
+    }
+}
+
+
+@pytest.fixture(scope="session")
+def sample_json_path(tmp_path_factory):
+    """
+    Writes the sample JSON file once and shares it between all the tests of the session.
+    """
+    file_path = tmp_path_factory.mktemp("json") / "sample.json"
+    with open(file_path, "w") as f:
+        json.dump(SAMPLE_JSON, f)
+    return file_path
+
 
 class TestJSONToDocument:
-    def test_run(self, test_files_path):
+    def test_run(self, sample_json_path):
         """
         Test if the component runs correctly.
         """
-        sample_json = {
-            "store": {
-                "book": [
-                    {"category": "fiction", "price": 8.95, "title": "Book A"},
-                    {"category": "non-fiction", "price": 12.99, "title": "Book B"}
-                ]
-            }
-        }
-
-        # Save JSON content to a file
-        file_path = test_files_path / "json" / "sample.json"
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(file_path, "w") as f:
-            json.dump(sample_json, f)
-
         converter = JSONToDocument()
-        bytestream = ByteStream.from_file_path(file_path, meta={"file_path": str(file_path)})
+        bytestream = ByteStream.from_file_path(sample_json_path, meta={"file_path": str(sample_json_path)})
         output = converter.run(sources=[bytestream])
         docs = output["documents"]
         assert len(docs) == 1
         assert "store_book_0_category" in docs[0].content
-        assert docs[0].meta["file_path"] == str(file_path)
+        assert docs[0].meta["file_path"] == str(sample_json_path)
 
-    def test_run_error_handling(self, test_files_path, caplog):
+    def test_run_error_handling(self, sample_json_path, caplog):
         """
         Test if the component correctly handles errors.
         """
-        paths = [test_files_path / "json" / "sample.json", "non_existing_file.json"]
+        paths = [sample_json_path, "non_existing_file.json"]
         converter = JSONToDocument()
         with caplog.at_level(logging.WARNING):
             output = converter.run(sources=paths)
@@ -51,30 +59,87 @@ class TestJSONToDocument:
         assert len(docs) == 1
         assert docs[0].meta["file_path"] == str(paths[0])
 
-    def test_run_with_meta(self, test_files_path):
+    def test_run_with_meta(self, sample_json_path):
         """
         Test if the component correctly merges metadata.
         """
-        sample_json = {
-            "store": {
-                "book": [
-                    {"category": "fiction", "price": 8.95, "title": "Book A"},
-                    {"category": "non-fiction", "price": 12.99, "title": "Book B"}
-                ]
-            }
-        }
-
-        # Save JSON content to a file
-        file_path = test_files_path / "json" / "sample.json"
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(file_path, "w") as f:
-            json.dump(sample_json, f)
-
         converter = JSONToDocument()
-        bytestream = ByteStream.from_file_path(file_path, meta={"author": "test_author"})
+        bytestream = ByteStream.from_file_path(sample_json_path, meta={"author": "test_author"})
         output = converter.run(sources=[bytestream], meta={"language": "en"})
         document = output["documents"][0]
 
         # Validate the metadata merge
         assert document.meta["author"] == "test_author"
         assert document.meta["language"] == "en"
+
+    def test_run_with_non_standard_json_values(self):
+        """
+        Test if the component parses values that are not part of the JSON standard but accepted by `json.loads`.
+        """
+        bytestream = ByteStream.from_string('{"price": NaN}')
+        converter = JSONToDocument()
+        output = converter.run(sources=[bytestream])
+        docs = output["documents"]
+        assert len(docs) == 1
+        assert docs[0].content == '{"price": NaN}'
+
+    @pytest.mark.parametrize("value", [2**64, -(2**63) - 1, 123456789012345678901234567890])
+    def test_run_with_integers_outside_64_bit_range(self, value):
+        """
+        Test if the component keeps integers outside the 64-bit range exact.
+        """
+        bytestream = ByteStream.from_string(json.dumps({"id": value}))
+        converter = JSONToDocument()
+        output = converter.run(sources=[bytestream])
+        docs = output["documents"]
+        assert len(docs) == 1
+        assert docs[0].content == f'{{"id": {value}}}'
+
+    def test_run_with_max_workers(self, caplog):
+        """
+        Test if the component keeps the order of the sources when converting them in parallel.
+        """
+        sources = [ByteStream.from_string(json.dumps({"id": i}), meta={"id": i}) for i in range(10)]
+        sources.insert(5, "non_existing_file.json")
+        converter = JSONToDocument(max_workers=4)
+        with patch(
+            "haystack.components.converters.json.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+        ) as executor, caplog.at_level(logging.WARNING):
+            output = converter.run(sources=sources)
+            assert "non_existing_file.json" in caplog.text
+        executor.assert_called_once_with(max_workers=4)
+        docs = output["documents"]
+        assert len(docs) == 10
+        assert [doc.meta["id"] for doc in docs] == list(range(10))
+        assert [json.loads(doc.content) for doc in docs] == [{"id": i} for i in range(10)]
+
+    def test_run_with_single_worker_does_not_use_threads(self):
+        """
+        Test if the component converts the sources in the calling thread by default.
+        """
+        sources = [ByteStream.from_string(json.dumps({"id": i})) for i in range(3)]
+        converter = JSONToDocument()
+        with patch("haystack.components.converters.json.ThreadPoolExecutor") as executor:
+            output = converter.run(sources=sources)
+        executor.assert_not_called()
+        assert len(output["documents"]) == 3
+
+    @pytest.mark.parametrize("max_workers", [0, -1])
+    def test_init_with_invalid_max_workers(self, max_workers):
+        """
+        Test if the component rejects a number of workers smaller than 1.
+        """
+        with pytest.raises(ValueError, match="max_workers"):
+            JSONToDocument(max_workers=max_workers)
+
+    @pytest.mark.parametrize("encoding", ["utf-8-sig", "utf-16", "utf-32"])
+    def test_run_with_byte_order_mark(self, encoding):
+        """
+        Test if the component detects the encoding of JSON starting with a byte order mark.
+        """
+        bytestream = ByteStream.from_string('{"store": {"name": "Books"}}', encoding=encoding)
+        converter = JSONToDocument()
+        output = converter.run(sources=[bytestream])
+        docs = output["documents"]
+        assert len(docs) == 1
+        assert docs[0].content == '{"store_name": "Books"}'